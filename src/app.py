@@ -8,6 +8,7 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+import contextvars
 import os
 from pathlib import Path
 
@@ -78,19 +79,49 @@ activities = {
 }
 
 
+def _build_participant_index(activities):
+    """Map each activity name to a set of its participants"""
+    return {name: set(details["participants"]) for name, details in activities.items()}
+
+
+# Set view of each activity's participants for O(1) membership checks; the
+# lists above stay the source of truth for the JSON responses
+_participant_index = _build_participant_index(activities)
+
+# (activities, participant index) pair bound to the current context; unset
+# means the module-level data, while tests bind their own copy per test
+_current_state = contextvars.ContextVar("activity_state", default=None)
+
+
+def _make_state(activities):
+    """Pair an activities dict with a participant index built from it"""
+    return activities, _build_participant_index(activities)
+
+
+def _get_state():
+    """Return the activities and participant index for the current context"""
+    state = _current_state.get()
+    if state is None:
+        return activities, _participant_index
+    return state
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
+async def get_activities():
+    activities, _ = _get_state()
     return activities
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
+    activities, participant_index = _get_state()
+
     # Validate activity exists
     if activity_name not in activities:
         raise HTTPException(status_code=404, detail="Activity not found")
@@ -99,17 +130,24 @@ def signup_for_activity(activity_name: str, email: str):
     activity = activities[activity_name]
 
     # Validate student is not already signed up
-    if email in activity["participants"]:
+    participant_set = participant_index[activity_name]
+    if email in participant_set:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     
     # Add student
     activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+    participant_set.add(email)
+    return {
+        "message": f"Signed up {email} for {activity_name}",
+        "participants": activity["participants"]
+    }
 
 
 @app.post("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+async def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
+    activities, participant_index = _get_state()
+
     # Validate activity exists
     if activity_name not in activities:
         raise HTTPException(status_code=404, detail="Activity not found")
@@ -118,9 +156,14 @@ def unregister_from_activity(activity_name: str, email: str):
     activity = activities[activity_name]
 
     # Validate student is signed up
-    if email not in activity["participants"]:
+    participant_set = participant_index[activity_name]
+    if email not in participant_set:
         raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
     
     # Remove student
     activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+    participant_set.discard(email)
+    return {
+        "message": f"Unregistered {email} from {activity_name}",
+        "participants": activity["participants"]
+    }
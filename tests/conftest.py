@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration for the Mergington High School Activities API tests
+"""
+
+import httpx
+import orjson
+import pytest
+
+
+_httpx_json = httpx.Response.json
+
+
+def _orjson_json(self, **kwargs):
+    """Parse the response body with orjson instead of the stdlib json module"""
+    if kwargs:
+        # orjson has no equivalent of json.loads options such as parse_float
+        return _httpx_json(self, **kwargs)
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def orjson_responses():
+    """Decode every response.json() call in the session with orjson"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", _orjson_json)
+        yield
@@ -2,109 +2,68 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
+import pickle
+
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
-# Add src directory to path to import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import app as app_module
+from app import app
 
-from app import app, activities
 
+# Run every test on the session-wide event loop shared with the client
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(scope="session")
+def transport():
+    """Create the in-process ASGI transport shared by every request"""
+    return ASGITransport(app=app, raise_app_exceptions=True)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(transport):
+    """Create an async test client shared by the whole test session"""
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
 
-@pytest.fixture
-def client():
-    """Create a test client"""
-    return TestClient(app)
+
+# Pickled snapshot of the in-memory activity database taken once at import,
+# before any test has mutated it; each test unpickles its own copy
+_ORIGINAL_BLOB = pickle.dumps(app_module.activities, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 @pytest.fixture
 def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    original = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Tennis skills development and friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and visual arts exploration",
-            "schedule": "Mondays and Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Music Ensemble": {
-            "description": "Orchestra and band performance group",
-            "schedule": "Wednesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["noah@mergington.edu", "ava@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop public speaking and argumentation skills",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["lucas@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Explore science through experiments and projects",
-            "schedule": "Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["mason@mergington.edu", "chloe@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset
-    activities.clear()
-    activities.update(original)
+    """Give each test its own fresh copy of the initial activities"""
+    token = app_module._current_state.set(
+        app_module._make_state(pickle.loads(_ORIGINAL_BLOB))
+    )
     yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original)
+    app_module._current_state.reset(token)
 
 
 class TestGetActivities:
-    """Tests for GET /activities endpoint"""
+    """Tests for GET /activities endpoint
+
+    These tests only read, so they skip reset_activities and see the
+    module-level data through the default context.
+    """
     
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
+    async def test_get_activities_returns_all_activities(self, client):
         """Test that get_activities returns all available activities"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 9
         assert "Chess Club" in data
         assert "Programming Class" in data
     
-    def test_get_activities_contains_activity_details(self, client, reset_activities):
+    async def test_get_activities_contains_activity_details(self, client):
         """Test that each activity contains required fields"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         activity = data["Chess Club"]
         
@@ -113,73 +72,93 @@ class TestGetActivities:
         assert "max_participants" in activity
         assert "participants" in activity
     
-    def test_get_activities_contains_participants(self, client, reset_activities):
+    async def test_get_activities_contains_participants(self, client):
         """Test that activities contain participant information"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         
         assert "michael@mergington.edu" in data["Chess Club"]["participants"]
         assert "daniel@mergington.edu" in data["Chess Club"]["participants"]
 
 
-class TestSignup:
-    """Tests for POST /activities/{activity_name}/signup endpoint"""
-    
-    def test_signup_successful(self, client, reset_activities):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "newstudent@mergington.edu"}
+class TestOperationResponses:
+    """Status codes and messages for POST signup/unregister endpoints"""
+    
+    @pytest.mark.parametrize(
+        "operation,activity,email,status,text",
+        [
+            pytest.param("signup", "Chess Club", "newstudent@mergington.edu", 200, "Signed up",
+                         id="signup-successful"),
+            pytest.param("signup", "Chess Club", "michael@mergington.edu", 400, "already signed up",
+                         id="signup-duplicate-email"),
+            pytest.param("signup", "Nonexistent Club", "student@mergington.edu", 404, "Activity not found",
+                         id="signup-nonexistent-activity"),
+            pytest.param("unregister", "Chess Club", "michael@mergington.edu", 200, "Unregistered",
+                         id="unregister-successful"),
+            pytest.param("unregister", "Chess Club", "notparticipant@mergington.edu", 400, "not signed up",
+                         id="unregister-not-signed-up"),
+            pytest.param("unregister", "Nonexistent Club", "student@mergington.edu", 404, "Activity not found",
+                         id="unregister-nonexistent-activity"),
+        ]
+    )
+    async def test_operation_response(self, client, reset_activities,
+                                      operation, activity, email, status, text):
+        """Test the status code and message returned for each operation"""
+        response = await client.post(
+            f"/activities/{activity}/{operation}",
+            params={"email": email}
         )
-        assert response.status_code == 200
+        assert response.status_code == status
         data = response.json()
-        assert "Signed up" in data["message"]
-        assert "newstudent@mergington.edu" in data["message"]
+        if status == 200:
+            assert text in data["message"]
+            assert email in data["message"]
+        else:
+            assert text in data["detail"]
+
+
+class TestSignup:
+    """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_adds_participant_to_list(self, client, reset_activities):
+    async def test_signup_adds_participant_to_list(self, client, reset_activities):
         """Test that signup actually adds participant to the activity"""
-        client.post(
+        response = await client.post(
             "/activities/Basketball Team/signup",
             params={"email": "newplayer@mergington.edu"}
         )
         
-        response = client.get("/activities")
-        activity = response.json()["Basketball Team"]
-        assert "newplayer@mergington.edu" in activity["participants"]
-        assert len(activity["participants"]) == 2
-    
-    def test_signup_duplicate_email_fails(self, client, reset_activities):
-        """Test that duplicate signup returns 400 error"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "michael@mergington.edu"}
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
-    
-    def test_signup_nonexistent_activity_fails(self, client, reset_activities):
-        """Test that signup for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup",
-            params={"email": "student@mergington.edu"}
+        participants = response.json()["participants"]
+        assert "newplayer@mergington.edu" in participants
+        assert len(participants) == 2
+    
+    @pytest.mark.parametrize(
+        "email",
+        ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
+    )
+    async def test_signup_multiple_students(self, client, reset_activities, email):
+        """Test signing up each of several different students"""
+        response = await client.post(
+            "/activities/Tennis Club/signup",
+            params={"email": email}
         )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
-    def test_signup_multiple_students(self, client, reset_activities):
-        """Test signing up multiple different students"""
-        emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
+        assert response.status_code == 200
         
-        for email in emails:
-            response = client.post(
-                "/activities/Tennis Club/signup",
-                params={"email": email}
-            )
+        participants = response.json()["participants"]
+        assert email in participants
+        assert len(participants) == 3
+
+    async def test_signup_multiple_students_accumulate(self, client, reset_activities):
+        """Test that signing up several students adds all of them"""
+        emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
+
+        responses = await asyncio.gather(*[
+            client.post("/activities/Tennis Club/signup", params={"email": email})
+            for email in emails
+        ])
+        for response in responses:
             assert response.status_code == 200
-        
-        response = client.get("/activities")
+
+        response = await client.get("/activities")
         activity = response.json()["Tennis Club"]
         assert len(activity["participants"]) == 5
 
@@ -187,61 +166,31 @@ class TestSignup:
 class TestUnregister:
     """Tests for POST /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_successful(self, client, reset_activities):
-        """Test successful unregister from an activity"""
-        response = client.post(
-            "/activities/Chess Club/unregister",
-            params={"email": "michael@mergington.edu"}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "Unregistered" in data["message"]
-        assert "michael@mergington.edu" in data["message"]
-    
-    def test_unregister_removes_participant(self, client, reset_activities):
+    async def test_unregister_removes_participant(self, client, reset_activities):
         """Test that unregister actually removes participant from activity"""
-        client.post(
+        response = await client.post(
             "/activities/Chess Club/unregister",
             params={"email": "daniel@mergington.edu"}
         )
         
-        response = client.get("/activities")
-        activity = response.json()["Chess Club"]
-        assert "daniel@mergington.edu" not in activity["participants"]
-        assert len(activity["participants"]) == 1
+        participants = response.json()["participants"]
+        assert "daniel@mergington.edu" not in participants
+        assert len(participants) == 1
     
-    def test_unregister_not_signed_up_fails(self, client, reset_activities):
-        """Test that unregister for non-participant returns 400"""
-        response = client.post(
-            "/activities/Chess Club/unregister",
-            params={"email": "notparticipant@mergington.edu"}
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"]
-    
-    def test_unregister_nonexistent_activity_fails(self, client, reset_activities):
-        """Test that unregister from non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Club/unregister",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
-    def test_unregister_all_participants(self, client, reset_activities):
+    async def test_unregister_all_participants(self, client, reset_activities):
         """Test unregistering all participants from an activity"""
         participants = ["michael@mergington.edu", "daniel@mergington.edu"]
         
-        for email in participants:
-            response = client.post(
-                "/activities/Chess Club/unregister",
-                params={"email": email}
-            )
+        responses = await asyncio.gather(*[
+            client.post("/activities/Chess Club/unregister", params={"email": email})
+            for email in participants
+        ])
+        parsed = [response.json() for response in responses]
+        for email, response, data in zip(participants, responses, parsed):
             assert response.status_code == 200
+            assert email in data["message"]
         
-        response = client.get("/activities")
+        response = await client.get("/activities")
         activity = response.json()["Chess Club"]
         assert len(activity["participants"]) == 0
 
@@ -249,55 +198,56 @@ class TestUnregister:
 class TestSignupAndUnregisterFlow:
     """Tests for combined signup and unregister flows"""
     
-    def test_signup_then_unregister(self, client, reset_activities):
+    async def test_signup_then_unregister(self, client, reset_activities):
         """Test signing up and then unregistering"""
         email = "testuser@mergington.edu"
         activity = "Programming Class"
         
         # Sign up
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity}/signup",
             params={"email": email}
         )
         assert response.status_code == 200
-        
-        # Verify signup
-        response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
+        assert email in response.json()["participants"]
         
         # Unregister
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity}/unregister",
             params={"email": email}
         )
         assert response.status_code == 200
+        assert email not in response.json()["participants"]
         
-        # Verify unregister
-        response = client.get("/activities")
+        # Verify end state
+        response = await client.get("/activities")
         assert email not in response.json()[activity]["participants"]
     
-    def test_signup_unregister_signup_again(self, client, reset_activities):
+    async def test_signup_unregister_signup_again(self, client, reset_activities):
         """Test signing up, unregistering, and signing up again"""
         email = "testuser@mergington.edu"
         activity = "Art Studio"
         
         # First signup
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity}/signup",
             params={"email": email}
         )
         assert response.status_code == 200
+        assert email in response.json()["participants"]
         
         # Unregister
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity}/unregister",
             params={"email": email}
         )
         assert response.status_code == 200
+        assert email not in response.json()["participants"]
         
         # Sign up again (should work)
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity}/signup",
             params={"email": email}
         )
         assert response.status_code == 200
+        assert response.json()["participants"].count(email) == 1